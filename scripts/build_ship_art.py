@@ -10,21 +10,40 @@ without additional dependencies.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 MODULE_TYPES = {"hull", "wing", "exhaust", "interior"}
 
+OPTIONAL_KEYS = frozenset({
+    "description",
+    "sockets",
+    "interiorAnchor",
+    "metrics",
+    "compatibleSockets",
+    "mirrorOf",
+    "tags",
+    "dependencies",
+    "vfxHooks",
+})
+
+MANIFEST_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+
+BUILD_STAMP_NAME = ".build_stamp"
+
 
 @dataclass
 class LodEntry:
     level: int
-    mesh: Path
-    collision: Optional[Path]
+    mesh: str
+    collision: Optional[str]
 
 
 @dataclass
@@ -34,9 +53,17 @@ class ModuleAsset:
     display_name: str
     source: Dict
     lods: List[LodEntry]
-    materials: List[Path]
-    thumbnails: List[Path]
-    extra_files: List[Path]
+    materials: List[str]
+    thumbnails: List[str]
+    extra_files: List[str]
+
+
+@dataclass(frozen=True)
+class CopyJob:
+    src: str
+    dest: str
+    module_id: str
+    field: str
 
 
 class ValidationError(Exception):
@@ -68,34 +95,22 @@ def read_manifest(manifest_path: Path) -> Dict:
     return data
 
 
-def ensure_relative_path(base_dir: Path, relative_str: str, field: str, module_id: str) -> Path:
+def ensure_relative_path(base_dir_str: str, relative_str: str, field: str, module_id: str) -> str:
     if not isinstance(relative_str, str) or not relative_str:
         raise ValidationError(f"Module '{module_id}' has invalid {field}: expected string path")
 
-    relative_path = Path(relative_str)
-    resolved = (base_dir / relative_path).resolve()
-    try:
-        base_dir.resolve()
-    except FileNotFoundError:
-        # parent directories may not exist yet, insist on their presence separately
-        pass
+    resolved = os.path.realpath(os.path.join(base_dir_str, relative_str))
 
-    if not resolved.exists():
+    prefix = base_dir_str if base_dir_str.endswith(os.sep) else base_dir_str + os.sep
+    if resolved != base_dir_str and not resolved.startswith(prefix):
         raise ValidationError(
-            f"Module '{module_id}' references missing file for {field}: {relative_path}"
+            f"Module '{module_id}' {field} must stay within {base_dir_str}. Got: {relative_str}"
         )
 
-    try:
-        resolved.relative_to(base_dir.resolve())
-    except ValueError as exc:
-        raise ValidationError(
-            f"Module '{module_id}' {field} must stay within {base_dir}. Got: {relative_path}"
-        ) from exc
-
     return resolved
 
 
-def parse_module(defn: Dict, assets_dir: Path) -> ModuleAsset:
+def parse_module(defn: Dict, assets_root: str) -> ModuleAsset:
     if not isinstance(defn, dict):
         raise ValidationError("Each module entry must be an object")
 
@@ -128,29 +143,29 @@ def parse_module(defn: Dict, assets_dir: Path) -> ModuleAsset:
             raise ValidationError(f"Module '{module_id}' reuses LOD level {level}")
         seen_levels.add(level)
 
-        mesh_path = ensure_relative_path(assets_dir, lod.get("mesh"), "mesh", module_id)
+        mesh_path = ensure_relative_path(assets_root, lod.get("mesh"), "mesh", module_id)
         collision_path = None
         if lod.get("collision"):
             collision_path = ensure_relative_path(
-                assets_dir, lod["collision"], "collision", module_id
+                assets_root, lod["collision"], "collision", module_id
             )
         lods.append(LodEntry(level=level, mesh=mesh_path, collision=collision_path))
 
-    materials: List[Path] = []
+    materials: List[str] = []
     for material in defn.get("materials", []):
-        materials.append(ensure_relative_path(assets_dir, material, "materials", module_id))
+        materials.append(ensure_relative_path(assets_root, material, "materials", module_id))
 
-    thumbnails: List[Path] = []
+    thumbnails: List[str] = []
     thumb_field = defn.get("thumbnails")
     if isinstance(thumb_field, list):
         for thumb in thumb_field:
-            thumbnails.append(ensure_relative_path(assets_dir, thumb, "thumbnail", module_id))
+            thumbnails.append(ensure_relative_path(assets_root, thumb, "thumbnail", module_id))
     elif isinstance(defn.get("thumbnail"), str):
-        thumbnails.append(ensure_relative_path(assets_dir, defn["thumbnail"], "thumbnail", module_id))
+        thumbnails.append(ensure_relative_path(assets_root, defn["thumbnail"], "thumbnail", module_id))
 
-    extra_files: List[Path] = []
+    extra_files: List[str] = []
     for path in defn.get("extraFiles", []):
-        extra_files.append(ensure_relative_path(assets_dir, path, "extraFiles", module_id))
+        extra_files.append(ensure_relative_path(assets_root, path, "extraFiles", module_id))
 
     return ModuleAsset(
         module_id=module_id,
@@ -164,64 +179,221 @@ def parse_module(defn: Dict, assets_dir: Path) -> ModuleAsset:
     )
 
 
-def copy_into_bundle(files: Iterable[Path], bundle_root: Path, target_subdir: Path, dry_run: bool) -> List[str]:
-    copied: List[str] = []
+def plan_copies(
+    files: Iterable[str], bundle_root: str, target_subdir: str, module_id: str, field: str
+) -> Tuple[List[CopyJob], List[str]]:
+    jobs: List[CopyJob] = []
+    rel_paths: List[str] = []
     for src in files:
-        rel_target = target_subdir / src.name
-        dest = bundle_root / rel_target
-        if not dry_run:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dest)
-        copied.append(str(rel_target.as_posix()))
-    return copied
+        rel_target = f"{target_subdir}/{os.path.basename(src)}"
+        jobs.append(CopyJob(src, os.path.join(bundle_root, rel_target), module_id, field))
+        rel_paths.append(rel_target)
+    return jobs, rel_paths
+
+
+def _missing_file_error(job: CopyJob, assets_root: str) -> str:
+    return (
+        f"Module '{job.module_id}' references missing file for {job.field}: "
+        f"{os.path.relpath(job.src, assets_root)}"
+    )
+
+
+def _stat_sources(jobs: List[CopyJob], assets_root: str, errors: List[str]) -> Dict[str, os.stat_result]:
+    source_stats: Dict[str, os.stat_result] = {}
+    missing: Set[str] = set()
+    for job in jobs:
+        if job.src in source_stats:
+            continue
+        if job.src not in missing:
+            try:
+                source_stats[job.src] = os.stat(job.src)
+                continue
+            except (FileNotFoundError, NotADirectoryError):
+                missing.add(job.src)
+        errors.append(_missing_file_error(job, assets_root))
+    return source_stats
+
+
+def _remove_existing(dest: str) -> None:
+    try:
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+
+
+def _is_up_to_date(src_stat: os.stat_result, dest: str) -> bool:
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        return False
+    return dest_stat.st_size == src_stat.st_size and dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+
 
+def _copy_contents(src: str, dest: str, src_stat: os.stat_result) -> None:
+    shutil.copyfile(src, dest)
+    os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
 
-def build_bundle(assets_dir: Path, manifest: Dict, output_dir: Path, dry_run: bool) -> Dict:
+
+def _copy_job(job: CopyJob, src_stat: os.stat_result, assets_root: str, force: bool) -> None:
+    if not force and _is_up_to_date(src_stat, job.dest):
+        return
+    # Hardlinked bundle files are replaced, never written through.
+    _remove_existing(job.dest)
+    try:
+        _copy_contents(job.src, job.dest, src_stat)
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise ValidationError(_missing_file_error(job, assets_root)) from exc
+
+
+def _make_bundle_dirs(bundle_root: str, leaf_dirs: Iterable[str]) -> None:
+    pending: Set[str] = set()
+    for directory in leaf_dirs:
+        while directory and directory != bundle_root and directory not in pending:
+            pending.add(directory)
+            directory = os.path.dirname(directory)
+
+    for directory in sorted(pending, key=len):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+
+
+def execute_plan(
+    jobs: List[CopyJob],
+    bundle_root: str,
+    assets_root: str,
+    source_stats: Dict[str, os.stat_result],
+    force: bool = False,
+) -> None:
+    if not jobs:
+        return
+
+    # Later jobs targeting the same destination win, matching sequential copies.
+    by_dest: Dict[str, CopyJob] = {job.dest: job for job in jobs}
+
+    copied_cache: Dict[str, str] = {}
+    copies: List[CopyJob] = []
+    links: List[Tuple[CopyJob, str]] = []
+    for dest, job in by_dest.items():
+        first_dest = copied_cache.get(job.src)
+        if first_dest is None:
+            copied_cache[job.src] = dest
+            copies.append(job)
+        else:
+            links.append((job, first_dest))
+
+    # Create destination folders up-front so workers never race on mkdir.
+    _make_bundle_dirs(bundle_root, {os.path.dirname(dest) for dest in by_dest})
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(
+            lambda job: _copy_job(job, source_stats[job.src], assets_root, force), copies
+        ))
+
+    for job, first_dest in links:
+        src_stat = source_stats[job.src]
+        if not force and _is_up_to_date(src_stat, job.dest):
+            continue
+        _remove_existing(job.dest)
+        try:
+            os.link(first_dest, job.dest)
+        except OSError:
+            _copy_contents(first_dest, job.dest, src_stat)
+
+
+def _compute_build_stamp(
+    manifest_bytes: bytes, jobs: List[CopyJob], source_stats: Dict[str, os.stat_result]
+) -> bytes:
+    digest = hashlib.blake2b(manifest_bytes, digest_size=16)
+    for job in jobs:
+        src_stat = source_stats[job.src]
+        digest.update(
+            f"\0{job.src}\0{job.dest}\0{src_stat.st_mtime_ns}\0{src_stat.st_size}".encode("utf-8")
+        )
+    return digest.hexdigest().encode("ascii")
+
+
+def _bundle_matches_stamp(
+    output_dir: Path, stamp: bytes, jobs: List[CopyJob], source_stats: Dict[str, os.stat_result]
+) -> bool:
+    try:
+        if (output_dir / BUILD_STAMP_NAME).read_bytes() != stamp:
+            return False
+    except FileNotFoundError:
+        return False
+    if not (output_dir / "ship_art_manifest.compiled.json").exists():
+        return False
+    by_dest = {job.dest: job for job in jobs}
+    return all(_is_up_to_date(source_stats[job.src], dest) for dest, job in by_dest.items())
+
+
+def build_bundle(
+    assets_dir: Path,
+    manifest: Dict,
+    output_dir: Path,
+    dry_run: bool,
+    force: bool = False,
+    manifest_path: Optional[Path] = None,
+) -> Tuple[Dict, bool]:
     modules_out: List[Dict] = []
     errors: List[str] = []
+    jobs: List[CopyJob] = []
+    assets_root = str(assets_dir.resolve())
+    bundle_root = os.fspath(output_dir)
 
     for module_def in manifest["modules"]:
         try:
-            module = parse_module(module_def, assets_dir)
+            module = parse_module(module_def, assets_root)
         except ValidationError as exc:
             errors.append(str(exc))
             continue
 
-        module_target = Path("modules") / module.module_type / module.module_id
+        module_target = f"modules/{module.module_type}/{module.module_id}"
         lod_outputs: List[Dict] = []
         for lod in module.lods:
-            files_to_copy = [lod.mesh]
-            if lod.collision:
-                files_to_copy.append(lod.collision)
-            copied = copy_into_bundle(files_to_copy, output_dir, module_target / f"lod_{lod.level}", dry_run)
+            lod_target = f"{module_target}/lod_{lod.level}"
+            mesh_jobs, mesh_out = plan_copies([lod.mesh], bundle_root, lod_target, module.module_id, "mesh")
+            jobs.extend(mesh_jobs)
             lod_entry = {
                 "level": lod.level,
-                "mesh": copied[0]
+                "mesh": mesh_out[0]
             }
             if lod.collision:
-                lod_entry["collision"] = copied[1]
+                collision_jobs, collision_out = plan_copies(
+                    [lod.collision], bundle_root, lod_target, module.module_id, "collision"
+                )
+                jobs.extend(collision_jobs)
+                lod_entry["collision"] = collision_out[0]
             lod_outputs.append(lod_entry)
 
-        materials_out = copy_into_bundle(
+        material_jobs, materials_out = plan_copies(
             module.materials,
-            output_dir,
-            module_target / "materials",
-            dry_run,
+            bundle_root,
+            f"{module_target}/materials",
+            module.module_id,
+            "materials",
         )
+        jobs.extend(material_jobs)
 
-        thumbs_out = copy_into_bundle(
+        thumb_jobs, thumbs_out = plan_copies(
             module.thumbnails,
-            output_dir,
-            module_target / "thumbnails",
-            dry_run,
+            bundle_root,
+            f"{module_target}/thumbnails",
+            module.module_id,
+            "thumbnail",
         )
+        jobs.extend(thumb_jobs)
 
-        extras_out = copy_into_bundle(
+        extra_jobs, extras_out = plan_copies(
             module.extra_files,
-            output_dir,
-            module_target / "extras",
-            dry_run,
+            bundle_root,
+            f"{module_target}/extras",
+            module.module_id,
+            "extraFiles",
         )
+        jobs.extend(extra_jobs)
 
         sanitized = {
             "id": module.module_id,
@@ -230,19 +402,9 @@ def build_bundle(assets_dir: Path, manifest: Dict, output_dir: Path, dry_run: bo
             "lods": lod_outputs,
         }
 
-        for optional_key in (
-            "description",
-            "sockets",
-            "interiorAnchor",
-            "metrics",
-            "compatibleSockets",
-            "mirrorOf",
-            "tags",
-            "dependencies",
-            "vfxHooks",
-        ):
-            if optional_key in module.source:
-                sanitized[optional_key] = module.source[optional_key]
+        for key, value in module.source.items():
+            if key in OPTIONAL_KEYS:
+                sanitized[key] = value
 
         if materials_out:
             sanitized["materials"] = materials_out
@@ -253,6 +415,8 @@ def build_bundle(assets_dir: Path, manifest: Dict, output_dir: Path, dry_run: bo
 
         modules_out.append(sanitized)
 
+    source_stats = _stat_sources(jobs, assets_root, errors)
+
     if errors:
         joined = "\n".join(errors)
         raise ValidationError(f"Build failed with {len(errors)} error(s):\n{joined}")
@@ -263,14 +427,36 @@ def build_bundle(assets_dir: Path, manifest: Dict, output_dir: Path, dry_run: bo
         "modules": modules_out,
     }
 
-    if not dry_run:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        manifest_out = output_dir / "ship_art_manifest.compiled.json"
-        with manifest_out.open("w", encoding="utf-8") as handle:
-            json.dump(compiled, handle, indent=2, sort_keys=False)
-            handle.write("\n")
+    if dry_run:
+        return compiled, False
+
+    stamp_path = output_dir / BUILD_STAMP_NAME
+    stamp = None
+    if manifest_path is not None:
+        stamp = _compute_build_stamp(manifest_path.read_bytes(), jobs, source_stats)
+        if not force and _bundle_matches_stamp(output_dir, stamp, jobs, source_stats):
+            return compiled, False
+
+    # An interrupted rebuild must not leave the previous stamp looking current.
+    try:
+        stamp_path.unlink()
+    except FileNotFoundError:
+        pass
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    execute_plan(jobs, bundle_root, assets_root, source_stats, force)
+    manifest_out = output_dir / "ship_art_manifest.compiled.json"
+    with manifest_out.open("wb") as handle:
+        for chunk in MANIFEST_ENCODER.iterencode(compiled):
+            handle.write(chunk.encode("utf-8"))
+        handle.write(b"\n")
 
-    return compiled
+    if stamp is not None:
+        stamp_tmp = output_dir / f"{BUILD_STAMP_NAME}.tmp"
+        stamp_tmp.write_bytes(stamp)
+        os.replace(stamp_tmp, stamp_path)
+
+    return compiled, True
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -298,6 +484,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Validate manifest and report actions without copying files",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recopy every file, ignoring the build stamp and unchanged-file checks",
+    )
     return parser.parse_args(argv)
 
 
@@ -308,7 +499,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     try:
         manifest = read_manifest(manifest_path)
-        compiled = build_bundle(assets_dir, manifest, args.output_dir, args.dry_run)
+        compiled, wrote_manifest = build_bundle(
+            assets_dir, manifest, args.output_dir, args.dry_run, args.force, manifest_path
+        )
     except ValidationError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 1
@@ -316,9 +509,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     print(f"Packaged {len(compiled['modules'])} module(s) into {args.output_dir}")
     if args.dry_run:
         print("Dry-run complete. No files were written.")
-    else:
+    elif wrote_manifest:
         manifest_out = args.output_dir / "ship_art_manifest.compiled.json"
         print(f"Wrote compiled manifest: {manifest_out}")
+    else:
+        print(f"Bundle is up to date; nothing was written to {args.output_dir}")
 
     return 0
 
@@ -9,11 +9,13 @@ can be shipped alongside prebuilt binaries.
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 
 @dataclass
@@ -27,50 +29,73 @@ def parse_manifest(path: Path) -> List[ManifestEntry]:
         raise FileNotFoundError(f"manifest not found: {path}")
 
     entries: List[ManifestEntry] = []
+    seen: Set[Tuple[str, Path]] = set()
+    resolved_cache: Dict[str, Path] = {}
+    exists_cache: Dict[Path, bool] = {}
     with path.open("r", encoding="utf-8") as handle:
         for raw_line in handle:
             line = raw_line.strip()
             if not line or line.startswith("#"):
                 continue
-            delimiter = "=" if "=" in line else ":"
-            if delimiter not in line:
-                print(f"warning: skipping malformed line: {raw_line.rstrip()}", file=sys.stderr)
-                continue
-            left, right = line.split(delimiter, 1)
-            families = [alias.strip(" \"'\t").lower() for alias in left.split(",")]
+            left, sep, right = line.partition("=")
+            if not sep:
+                left, sep, right = line.partition(":")
+                if not sep:
+                    print(f"warning: skipping malformed line: {raw_line.rstrip()}", file=sys.stderr)
+                    continue
+            families = [alias.strip(" \"'\t") for alias in left.lower().split(",")]
             target = right.strip().strip("\"'")
             if not target:
                 continue
-            font_path = (path.parent / target).resolve()
+            font_path = resolved_cache.get(target)
+            if font_path is None:
+                font_path = (path.parent / target).resolve()
+                resolved_cache[target] = font_path
+            font_exists = exists_cache.get(font_path)
+            if font_exists is None:
+                font_exists = font_path.exists()
+                exists_cache[font_path] = font_exists
             for family in families:
                 if family == "default":
                     # default entry acts as fallback only; skip copying
                     continue
-                if not font_path.exists():
+                if not font_exists:
                     print(f"warning: font file missing for '{family}': {font_path}", file=sys.stderr)
                     continue
+                key = (family, font_path)
+                if key in seen:
+                    continue
+                seen.add(key)
                 entries.append(ManifestEntry(family=family, font_path=font_path))
     if not entries:
         raise RuntimeError("manifest did not contain any valid font entries")
     return entries
 
 
+def _copy_font(src: Path, dest: Path) -> None:
+    try:
+        src_stat = os.stat(src)
+        dest_stat = os.stat(dest)
+        if dest_stat.st_size == src_stat.st_size and dest_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dest)
+
+
 def package_fonts(manifest: Path, output_dir: Path, dry_run: bool) -> None:
     entries = parse_manifest(manifest)
-    copied: Dict[Path, Path] = {}
+    copies: Dict[Path, Path] = {output_dir / entry.font_path.name: entry.font_path for entry in entries}
 
-    if not dry_run:
+    if dry_run:
+        for dest, src in copies.items():
+            print(f"copy {src} -> {dest}")
+    else:
         output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_copy_font, copies.values(), copies.keys()))
 
-    for entry in entries:
-        dest = output_dir / entry.font_path.name
-        if dry_run:
-            print(f"copy {entry.font_path} -> {dest}")
-        else:
-            shutil.copy2(entry.font_path, dest)
-        copied[entry.font_path] = dest
-
-    print(f"Packaged {len(copied)} font file(s) into {output_dir}")
+    print(f"Packaged {len(copies)} font file(s) into {output_dir}")
     if dry_run:
         print("Dry-run: no files were copied.")
 